@@ -0,0 +1,46 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+def content_hash(content):
+    """Return a short BLAKE2b digest identifying a string or bytes value."""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def stream_hash(stream, chunk_size=1 << 20):
+    """Return the content_hash digest of a binary stream, reading it in chunks and rewinding it afterwards."""
+    digest = hashlib.blake2b(digest_size=16)
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry once maxsize is reached."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        """Store value under key, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
\ No newline at end of file
@@ -1,88 +1,428 @@
 from flask import Flask, request, jsonify, render_template
+from flask.json.provider import JSONProvider
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_seasurf import SeaSurf
 from werkzeug.utils import secure_filename
-from document_processor import extract_text_from_pdf
+from cache import LRUCache, content_hash, stream_hash
+import qa_engine
+from document_processor import extract_text, extract_text_from_upload
 from transformers import pipeline
-from docx import Document
+import torch
+import orjson
 import os
-import hashlib
+import platform
 import secrets
 import logging
-from datetime import datetime
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
-)
+import multiprocessing
+import atexit
+import functools
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+# Request threads only enqueue log records; a background listener thread does
+# the actual file and console writes.
+log_handlers = [
+    logging.FileHandler('app.log'),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+log_queue = queue.Queue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
 
-ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+log_listener = None
+
+def start_log_listener():
+    """Start the background thread that writes queued log records to log_handlers."""
+    global log_listener
+    log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+
+def stop_log_listener():
+    """Flush any queued log records and stop the listener thread."""
+    log_listener.stop()
+
+start_log_listener()
+atexit.register(stop_log_listener)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Read the key from the environment so sessions survive restarts and are
+# shared by every gunicorn worker
+SECRET_KEY = os.environ.get("CHATBOT_SECRET_KEY")
+if not SECRET_KEY:
+    logger.warning(
+        "CHATBOT_SECRET_KEY is not set; using a random key, sessions will not survive restarts "
+        "or be shared with other processes"
+    )
+    SECRET_KEY = secrets.token_hex(32)
 
 app = Flask(__name__,
-    template_folder=os.path.join(ROOT_DIR, 'frontend', 'templates'),
-    static_folder=os.path.join(ROOT_DIR, 'frontend', 'static')
+    template_folder=ROOT_DIR / 'frontend' / 'templates',
+    static_folder=ROOT_DIR / 'frontend' / 'static'
 )
 
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, which is several times faster on large document texts."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Used by both jsonify() and request.get_json()
+app.json = ORJSONProvider(app)
+
 # Security configurations
 app.config.update(
     MAX_CONTENT_LENGTH=16 * 1024 * 1024,  # 16MB max file size
-    SECRET_KEY=secrets.token_hex(32),
-    UPLOAD_FOLDER=os.path.join(ROOT_DIR, "temp"),
+    SECRET_KEY=SECRET_KEY,
     ALLOWED_EXTENSIONS={'pdf', 'docx'},
     SESSION_COOKIE_SECURE=False,
     SESSION_COOKIE_HTTPONLY=True,
     SESSION_COOKIE_SAMESITE='Lax',
     PERMANENT_SESSION_LIFETIME=1800,  # 30 minutes
+    SEND_FILE_MAX_AGE_DEFAULT=3600,  # static URLs are versioned, see static_version
     WTF_CSRF_ENABLED=True,
-    WTF_CSRF_SSL_STRICT=True
+    WTF_CSRF_SSL_STRICT=True,
+    CSRF_COOKIE_NAME='_csrf_token',
+    CSRF_HEADER_NAME='X-CSRFToken'
+)
+
+# Set up before SeaSurf so rate limits are enforced before the CSRF check
+limiter = Limiter(
+    app=app,
+    key_func=get_remote_address,
+    default_limits=["200 per day", "50 per hour"],
+    storage_uri="memory://"
 )
 
 csrf = SeaSurf(app)
 
-# Add CSRF error handler
+# Add CSRF error handler; SeaSurf rejects requests with a 403
 @app.errorhandler(400)
+@app.errorhandler(403)
 def csrf_error(reason):
-    logger.warning(f"CSRF Error: {reason}")
+    logger.warning("CSRF Error: %s", reason)
     return jsonify({
         "error": "CSRF validation failed. Please refresh the page and try again."
-    }), 400
+    }), reason.code
 
-limiter = Limiter(
-    app=app,
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
-)
+def cpu_supports_bf16():
+    """Check whether the CPU has native bfloat16 instructions (AVX512-BF16 or AMX)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in cpuinfo or "amx_bf16" in cpuinfo
+
+# Run on the first GPU in half precision when one is available. On CPU,
+# bfloat16 only pays off with native hardware support; otherwise emulating
+# it is slower than fp32.
+DEVICE = 0 if torch.cuda.is_available() else -1
+if torch.cuda.is_available():
+    DTYPE = torch.float16
+elif cpu_supports_bf16():
+    DTYPE = torch.bfloat16
+else:
+    DTYPE = torch.float32
+
+# Size the CPU thread pools explicitly rather than trusting the runtime
+# default, which can be a single thread in containers. gunicorn.conf.py
+# divides the cores between workers through CHATBOT_CPU_THREADS.
+CPU_THREADS = int(os.environ.get("CHATBOT_CPU_THREADS", os.cpu_count() or 1))
+if DEVICE == -1:
+    torch.set_num_threads(CPU_THREADS)
+
+def quantize_for_cpu(model):
+    """Dynamically quantize a model's Linear layers to int8 for faster CPU inference."""
+    try:
+        torch.backends.quantized.engine = "qnnpack" if platform.machine().lower() in ("arm64", "aarch64") else "fbgemm"
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        logger.warning("int8 quantization unavailable for %s, using fp32: %s", type(model).__name__, e)
+        return model
+
+def use_fused_attention(model):
+    """Swap a model's attention for PyTorch's fused BetterTransformer kernels, which skip padding tokens."""
+    try:
+        from optimum.bettertransformer import BetterTransformer
+        return BetterTransformer.transform(model)
+    except Exception as e:
+        logger.warning("BetterTransformer unavailable for %s, using stock attention: %s", type(model).__name__, e)
+        return model
+
+QA_MODEL = "deepset/roberta-base-squad2"
+QUANTIZED_QA_DIR = ROOT_DIR / "models" / "roberta-base-squad2-o3-int8"
+QUANTIZED_QA_FILE = "model_optimized_quantized.onnx"
+
+def load_quantized_qa_pipeline():
+    """Build a QA pipeline on an optimized, int8-quantized ONNX export of QA_MODEL, exporting it on first use."""
+    from optimum.onnxruntime import ORTModelForQuestionAnswering, ORTOptimizer, ORTQuantizer
+    from onnxruntime import SessionOptions
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+    from transformers import AutoTokenizer
+
+    if not (QUANTIZED_QA_DIR / QUANTIZED_QA_FILE).exists():
+        logger.info("Exporting quantized QA model to %s", QUANTIZED_QA_DIR)
+        model = ORTModelForQuestionAnswering.from_pretrained(QA_MODEL, export=True)
+        # O3: fuse attention/GELU/LayerNorm subgraphs and approximate GELU,
+        # then quantize the fused graph
+        optimizer = ORTOptimizer.from_pretrained(model)
+        optimization_config = OptimizationConfig(optimization_level=2, enable_gelu_approximation=True)
+        optimizer.optimize(save_dir=QUANTIZED_QA_DIR, optimization_config=optimization_config)
+        quantizer = ORTQuantizer.from_pretrained(QUANTIZED_QA_DIR, file_name="model_optimized.onnx")
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+        quantizer.quantize(save_dir=QUANTIZED_QA_DIR, quantization_config=qconfig)
+        model.config.save_pretrained(QUANTIZED_QA_DIR)
+        AutoTokenizer.from_pretrained(QA_MODEL).save_pretrained(QUANTIZED_QA_DIR)
+
+    session_options = SessionOptions()
+    session_options.intra_op_num_threads = CPU_THREADS
+    model = ORTModelForQuestionAnswering.from_pretrained(
+        QUANTIZED_QA_DIR, file_name=QUANTIZED_QA_FILE, session_options=session_options
+    )
+    tokenizer = AutoTokenizer.from_pretrained(QUANTIZED_QA_DIR)
+    return pipeline("question-answering", model=model, tokenizer=tokenizer)
 
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+def load_qa_pipeline():
+    """Load the QA pipeline: fp16 on GPU, int8 ONNX on CPU with a PyTorch fallback."""
+    if DEVICE == -1:
+        try:
+            return load_quantized_qa_pipeline()
+        except Exception as e:
+            logger.warning("Quantized ONNX QA model unavailable, falling back to PyTorch: %s", e)
+    qa = pipeline("question-answering", model=QA_MODEL, device=DEVICE, torch_dtype=DTYPE)
+    if DEVICE == -1 and DTYPE == torch.float32:
+        qa.model = quantize_for_cpu(qa.model)
+    else:
+        qa.model = use_fused_attention(qa.model)
+    return qa
 
 try:
-    qa_pipeline = pipeline("question-answering", model="deepset/roberta-base-squad2")
+    qa_pipeline = load_qa_pipeline()
     logger.info("Successfully loaded QA model")
 except Exception as e:
-    logger.error(f"Error loading QA model: {str(e)}")
+    logger.error("Error loading QA model: %s", e)
     qa_pipeline = None
 
-try:
-    summarizer = pipeline("summarization")
-    logger.info("Successfully loaded summarization model")
-except Exception as e:
-    logger.error(f"Error loading summarization model: {str(e)}")
-    summarizer = None
+def compile_qa_model():
+    """Compile the QA model with torch.compile, keeping the eager model if compilation fails."""
+    # ONNX Runtime models are already graph-optimized and are not nn.Modules
+    if not isinstance(qa_pipeline.model, torch.nn.Module):
+        return
+    eager_model = qa_pipeline.model
+    try:
+        # Batch size and padded length change with every micro-batch
+        qa_pipeline.model = torch.compile(eager_model, mode="reduce-overhead", dynamic=True)
+        # Compilation happens lazily, so trigger it now rather than on a user request
+        for _ in range(2):
+            run_qa_batch([("warmup", "warmup context.")])
+        logger.info("Compiled QA model")
+    except Exception as e:
+        logger.warning("torch.compile failed, using eager QA model: %s", e)
+        qa_pipeline.model = eager_model
+
+# The summarizer is only loaded when a text first needs the model, so workers
+# that never summarize do not pay for it in startup time or memory. Under
+# gunicorn with preloading it is loaded in the master instead and shared.
+summarizer = None
+summarizer_loaded = False
+summarizer_lock = threading.Lock()
+
+def get_summarizer():
+    """Return the summarization pipeline, loading it on first use; None if it failed to load."""
+    global summarizer, summarizer_loaded
+    with summarizer_lock:
+        if not summarizer_loaded:
+            try:
+                loaded = pipeline("summarization", device=DEVICE, torch_dtype=DTYPE)
+                # Without a GPU or native bf16, int8 Linear layers are the fastest CPU option
+                if DEVICE == -1 and DTYPE == torch.float32:
+                    loaded.model = quantize_for_cpu(loaded.model)
+                else:
+                    loaded.model = use_fused_attention(loaded.model)
+                summarizer = loaded
+                logger.info("Successfully loaded summarization model")
+            except Exception as e:
+                logger.error("Error loading summarization model: %s", e)
+            summarizer_loaded = True
+    return summarizer
+
+# Requests arriving within BATCH_WINDOW seconds of each other are run through
+# the model together, up to MAX_BATCH at a time.
+MAX_BATCH = 8
+BATCH_WINDOW = 0.02
+
+qa_queue = queue.Queue()
+summarize_queue = queue.Queue()
+
+def collect_batch(work_queue):
+    """Block for one queued request, then gather more until the batch is full or the window closes."""
+    batch = [work_queue.get()]
+    deadline = time.monotonic() + BATCH_WINDOW
+    while len(batch) < MAX_BATCH:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(work_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+# Tokenized contexts, so follow-up questions on a document skip re-tokenizing it
+context_cache = LRUCache(maxsize=64)
+
+def encode_context(context):
+    """Tokenize context for the QA model, reusing a cached encoding when available."""
+    key = content_hash(context)
+    encoded = context_cache.get(key)
+    if encoded is None:
+        encoded = qa_engine.encode_context(qa_pipeline.tokenizer, context)
+        context_cache.put(key, encoded)
+    return encoded
+
+def run_qa_batch(payloads):
+    """Answer a batch of (question, context) pairs in one forward pass."""
+    items = [(question, context, encode_context(context)) for question, context in payloads]
+    return qa_engine.answer_questions(qa_pipeline.model, qa_pipeline.tokenizer, items)
+
+def run_summarize_batch(payloads):
+    """Summarize a batch of texts in one pipeline call."""
+    return get_summarizer()(
+        payloads, max_length=130, min_length=30, do_sample=False, truncation=True, batch_size=len(payloads)
+    )
 
-def secure_temp_file(filename):
-    """Generate secure temporary filename."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    hash_name = hashlib.sha256(
-        f"{filename}{secrets.token_hex(16)}{timestamp}".encode()
-    ).hexdigest()
-    return f"{hash_name}"
+def resolve_batch(batch, run_batch):
+    """Run a batch of (payload, future) items and resolve each future with its result.
+
+    If a batch of several fails, each item is retried on its own, so one bad
+    or oversized request does not fail the unrelated requests batched with it.
+    """
+    try:
+        results = run_batch([payload for payload, _ in batch])
+    except Exception as e:
+        if len(batch) > 1:
+            logger.warning("Batch of %d failed, retrying its requests one by one: %s", len(batch), e)
+            for item in batch:
+                resolve_batch([item], run_batch)
+            return
+        logger.error("Batched request failed: %s", e)
+        batch[0][1].set_exception(e)
+    else:
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+def batch_worker(work_queue, run_batch):
+    """Drain work_queue in batches and resolve each request's future with its result."""
+    while True:
+        resolve_batch(collect_batch(work_queue), run_batch)
+
+def submit_to_batch(work_queue, payload):
+    """Queue a payload for batched inference and block until its result is ready."""
+    future = Future()
+    work_queue.put((payload, future))
+    return future.result()
+
+def start_batch_workers():
+    """Start one background batching thread per model."""
+    for work_queue, run_batch in ((qa_queue, run_qa_batch), (summarize_queue, run_summarize_batch)):
+        threading.Thread(target=batch_worker, args=(work_queue, run_batch), daemon=True).start()
+
+if qa_pipeline:
+    compile_qa_model()
+
+start_batch_workers()
+
+# Repeated questions on the same document (retries, polling) skip the model.
+# Contexts are keyed by digest so the cache never holds full document text.
+answer_cache = LRUCache(maxsize=1024)
+summary_cache = LRUCache(maxsize=128)
+
+def answer_question(question, context):
+    """Answer question from context, reusing the cached answer when the pair repeats."""
+    key = (question, content_hash(context))
+    answer = answer_cache.get(key)
+    if answer is None:
+        answer = submit_to_batch(qa_queue, (question, context))
+        answer_cache.put(key, answer)
+    return answer
+
+# Texts this short are returned as is or summarized by their opening sentences
+# instead of waiting on the model.
+SUMMARY_PASSTHROUGH_WORDS = 40
+SUMMARY_EXTRACTIVE_WORDS = 200
+# Extracted PDF text breaks lines with newlines, so any whitespace ends a sentence
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+def summarize_text(context):
+    """Summarize context, reusing the cached summary for a repeated document.
+
+    Returns None if the text needs the model and it is not available.
+    """
+    word_count = len(context.split())
+    if word_count <= SUMMARY_PASSTHROUGH_WORDS:
+        return {'summary_text': context}
+    if word_count <= SUMMARY_EXTRACTIVE_WORDS:
+        summary = " ".join(" ".join(SENTENCE_BOUNDARY_RE.split(context, maxsplit=2)[:2]).split())
+        if not summary.endswith(('.', '!', '?')):
+            summary += "."
+        return {'summary_text': summary}
+
+    key = content_hash(context)
+    summary = summary_cache.get(key)
+    if summary is None:
+        if not get_summarizer():
+            return None
+        summary = submit_to_batch(summarize_queue, context)
+        summary_cache.put(key, summary)
+    return summary
+
+def warmup_models():
+    """Run a tiny inference through each loaded model so the first real request skips lazy initialisation."""
+    if qa_pipeline:
+        run_qa_batch([("warmup", "warmup context.")])
+        logger.info("QA model warmed up")
+    if summarizer:
+        summarizer("warmup text " * 20, max_length=30, min_length=10)
+        logger.info("Summarization model warmed up")
+
+# Multi-character tokens such as "!=", "||" or "/*" are already caught by the
+# single-character set, so only the remaining sequences need the regex.
+INJECTION_CHARACTERS = frozenset("'\";()=<>\\|&`$*[]\r\n{}:")
+INJECTION_RE = re.compile("|".join(map(re.escape, ["--", "LIKE", "UNION"])))
+
+def has_injection_characters(text):
+    """Check text for characters or keywords commonly used in injection attacks."""
+    return not INJECTION_CHARACTERS.isdisjoint(text) or INJECTION_RE.search(text) is not None
+
+def validate_text(value, name, max_length=None, scan_injection=False):
+    """Strip and validate a text field in a single pass.
+
+    Returns (is_valid, error_message, text) where text is the stripped value.
+    """
+    text = value.strip()
+    if not text:
+        return False, f"{name} is required", text
+    if max_length is not None and len(text) > max_length:
+        return False, f"{name} too long (max {max_length} characters)", text
+    if scan_injection and has_injection_characters(text):
+        logger.warning("Malicious input detected in %s: %s", name.lower(), text)
+        return False, f"The given text may contain malicious content. Please revise your {name.lower()}.", text
+    return True, None, text
 
 def validate_file(file):
     """Validate file type and content."""
@@ -94,10 +434,83 @@ def validate_file(file):
     
     return True, None
 
-def extract_text_from_docx(docx_path):
-    """Extract text from a DOCX file."""
-    doc = Document(docx_path)
-    return "\n".join([para.text for para in doc.paragraphs])
+def extract_uploaded_file(file):
+    """Extract text from a single upload, reading straight from the request stream."""
+    # Werkzeug already buffers the upload in memory or a temporary file, so
+    # there is no need to copy it anywhere else first
+    file.stream.seek(0)
+    return extract_text(file.filename, file.stream)
+
+# pdfplumber is pure Python and holds the GIL, so multi-file uploads are
+# parsed in worker processes. They come from a forkserver rather than a fork
+# of this threaded, torch-holding process, and the pool is started on first
+# use so each gunicorn worker gets its own.
+extract_executor = None
+extract_executor_lock = threading.Lock()
+
+def get_extract_executor():
+    """Return this process's extraction pool, starting it on first use."""
+    global extract_executor
+    with extract_executor_lock:
+        if extract_executor is None:
+            extract_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context("forkserver")
+            )
+    return extract_executor
+
+def extract_uploaded_files(files):
+    """Extract text from several uploads in parallel, returning (filename, text, error) tuples in order."""
+    filenames = [file.filename for file in files]
+    contents = []
+    for file in files:
+        file.stream.seek(0)
+        contents.append(file.stream.read())
+    # Pool processes re-run the __main__ script, which under the development
+    # server (python chatbot.py) would load the models again in every one
+    if __name__ == '__main__':
+        return list(map(extract_text_from_upload, filenames, contents))
+    return list(get_extract_executor().map(extract_text_from_upload, filenames, contents))
+
+# Text extracted from recent uploads, keyed on the file contents, so
+# re-uploading the same document skips extraction.
+extracted_text_cache = LRUCache(maxsize=32)
+
+def extract_uploads(files):
+    """Extract text from uploads, returning (filename, text, error) tuples in order.
+
+    Files seen before are served from extracted_text_cache; the rest are
+    extracted directly when there is one, or in parallel when there are several.
+    """
+    keys = [stream_hash(file.stream) for file in files]
+    results = [(file.filename, extracted_text_cache.get(key), None) for file, key in zip(files, keys)]
+    missing = [i for i, (_, text, _) in enumerate(results) if text is None]
+    if len(missing) == 1:
+        file = files[missing[0]]
+        extracted = [(file.filename, extract_uploaded_file(file), None)]
+    elif missing:
+        extracted = extract_uploaded_files([files[i] for i in missing])
+    else:
+        extracted = []
+
+    for i, result in zip(missing, extracted):
+        results[i] = result
+        if not result[2]:
+            extracted_text_cache.put(keys[i], result[1])
+    return results
+
+@functools.lru_cache(maxsize=None)
+def static_version(filename):
+    """Return a digest of a static file's contents, computed once per process."""
+    return content_hash((Path(app.static_folder) / filename).read_bytes())[:12]
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """Append a content version to static URLs so browsers refetch assets changed by a deploy."""
+    if endpoint == 'static' and 'filename' in values:
+        try:
+            values.setdefault('v', static_version(values['filename']))
+        except OSError:
+            pass
 
 @app.route('/')
 def index():
@@ -105,33 +518,30 @@ def index():
     try:
         return render_template('index.html')
     except Exception as e:
-        logger.error(f"Error rendering template: {str(e)}")
+        logger.error("Error rendering template: %s", e)
         return f"Error: {str(e)}", 500
 
 @app.route('/upload', methods=['POST'])
 @limiter.limit("10 per minute")
 def upload_file():
-    """Handle file upload and process the PDF or DOCX."""
+    """Handle upload of one or more PDF or DOCX files and extract their text."""
     if 'file' not in request.files:
         return jsonify({"error": "No file part"}), 400
 
-    file = request.files['file']
-    is_valid, error_message = validate_file(file)
-    
-    if not is_valid:
-        return jsonify({"error": error_message}), 400
+    files = request.files.getlist('file')
+    for file in files:
+        is_valid, error_message = validate_file(file)
+        if not is_valid:
+            return jsonify({"error": error_message}), 400
 
     try:
-        secure_name = secure_temp_file(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], secure_name)
-        file.save(file_path)
-        logger.info(f"File saved successfully: {secure_name}")
-
-        if file.filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(file_path)
-        else:
-            text = extract_text_from_docx(file_path)
-        
+        results = extract_uploads(files)
+        errors = [f"{filename}: {error}" for filename, _, error in results if error]
+        if errors:
+            logger.error("Error processing files: %s", '; '.join(errors))
+            return jsonify({"error": "; ".join(errors)}), 500
+
+        text = "\n".join(text for _, text, _ in results)
         if not text.strip():
             return jsonify({"error": "No text could be extracted from the document"}), 400
 
@@ -141,17 +551,9 @@ def upload_file():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error processing file: {str(e)}")
+        logger.error("Error processing file: %s", e)
         return jsonify({"error": str(e)}), 500
 
-    finally:
-        if 'file_path' in locals() and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                logger.info(f"Temporary file removed: {secure_name}")
-            except Exception as e:
-                logger.error(f"Error removing temporary file: {str(e)}")
-
 @app.route('/ask', methods=['POST'])
 @limiter.limit("30 per minute")
 def ask_question():
@@ -160,35 +562,25 @@ def ask_question():
         if not qa_pipeline:
             return jsonify({"error": "QA model not available"}), 503
 
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({"error": "Invalid JSON"}), 400
 
-        question = data.get("question", "").strip()
-        context = data.get("context", "").strip()
+        is_valid, error_message, question = validate_text(
+            data.get("question", ""), "Question", max_length=1000, scan_injection=True
+        )
+        if not is_valid:
+            return jsonify({"error": error_message}), 400
 
-        if not question or not context:
-            return jsonify({"error": "Question and context are required"}), 400
+        is_valid, error_message, context = validate_text(data.get("context", ""), "Context", max_length=100000)
+        if not is_valid:
+            return jsonify({"error": error_message}), 400
 
-        if len(question) > 1000:
-            return jsonify({"error": "Question too long (max 1000 characters)"}), 400
-        if len(context) > 100000:
-            return jsonify({"error": "Context too long (max 100000 characters)"}), 400
-
-        injection_characters = [
-            "'", "\"", "--", "/*", "*/", ";", "(", ")", "=", "<", ">", "!=",
-            "LIKE", "UNION", "||", "\\", "|", "&", "`", "$", "*", "[", "]",
-            "&&", ">", ">>", "\r", "\n", "{", "}", ":"
-        ]
-        if any(char in question for char in injection_characters):
-            logger.warning(f"Malicious input detected in question: {question}")
-            return jsonify({"error": "The given text may contain malicious content. Please revise your question."}), 400
-
-        logger.debug(f"Processing question: {question}")
+        logger.debug("Processing question: %s", question)
         
         try:
-            answer = qa_pipeline(question=question, context=context)
-            logger.debug(f"Generated answer: {answer}")
+            answer = answer_question(question, context)
+            logger.debug("Generated answer: %s", answer)
 
             if answer['score'] < 0.3:
                 logger.warning("Potential hallucination detected.")
@@ -205,11 +597,11 @@ def ask_question():
             }), 200
 
         except Exception as e:
-            logger.error(f"Error generating answer: {str(e)}")
+            logger.error("Error generating answer: %s", e)
             return jsonify({"error": "Error generating answer"}), 500
 
     except Exception as e:
-        logger.error(f"Ask question error: {str(e)}")
+        logger.error("Ask question error: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @app.route('/summarize', methods=['POST'])
@@ -217,35 +609,38 @@ def ask_question():
 def summarize_document():
     """Summarize the uploaded document's text."""
     try:
-        if not summarizer:
-            return jsonify({"error": "Summarization model not available"}), 503
-
-        data = request.get_json()
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({"error": "Invalid JSON"}), 400
 
-        context = data.get("context", "").strip()
+        is_valid, error_message, context = validate_text(data.get("context", ""), "Context")
+        if not is_valid:
+            return jsonify({"error": error_message}), 400
 
-        if not context:
-            return jsonify({"error": "Context is required for summarization"}), 400
-
-        summary = summarizer(context, max_length=130, min_length=30, do_sample=False)
-        logger.debug(f"Generated summary: {summary}")
+        summary = summarize_text(context)
+        if summary is None:
+            return jsonify({"error": "Summarization model not available"}), 503
+        logger.debug("Generated summary: %s", summary)
 
         return jsonify({
-            "summary": summary[0]['summary_text']
+            "summary": summary['summary_text']
         }), 200
 
     except Exception as e:
-        logger.error(f"Summarization error: {str(e)}")
+        logger.error("Summarization error: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @app.route('/health')
 def health_check():
-    """Health check endpoint."""
+    """Health check endpoint.
+
+    Reports whether the models loaded without running any inference, so
+    frequent liveness probes stay cheap.
+    """
     return jsonify({
         "status": "healthy",
-        "model": "loaded"
+        "model": "loaded" if qa_pipeline else "unavailable",
+        "summarizer": ("loaded" if summarizer else "unavailable") if summarizer_loaded else "not loaded"
     }), 200
 
 @app.errorhandler(404)
@@ -283,13 +678,12 @@ def apply_security_headers(response):
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"Internal server error: {str(e)}")
+    logger.error("Internal server error: %s", error)
     return jsonify({"error": "Internal server error"}), 500
 
 if __name__ == '__main__':
     logger.info("Starting application...")
-    logger.info(f"Template folder: {app.template_folder}")
-    logger.info(f"Static folder: {app.static_folder}")
-    logger.info(f"Upload folder: {app.config['UPLOAD_FOLDER']}")
+    logger.info("Template folder: %s", app.template_folder)
+    logger.info("Static folder: %s", app.static_folder)
     
-    app.run(debug=True)
\ No newline at end of file
+    app.run()
\ No newline at end of file
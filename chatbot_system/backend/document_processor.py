@@ -1,9 +1,32 @@
+import io
 import pdfplumber
+from docx import Document
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from a PDF file using pdfplumber."""
+def extract_text_from_pdf(pdf_file):
+    """Extract text from a PDF file using pdfplumber, given a path or binary file object."""
     text = ""
-    with pdfplumber.open(pdf_path) as pdf:
+    with pdfplumber.open(pdf_file) as pdf:
         for page in pdf.pages:
             text += page.extract_text() + "\n"
-    return text
\ No newline at end of file
+    return text
+
+def extract_text_from_docx(docx_file):
+    """Extract text from a DOCX file, given a path or binary file object."""
+    doc = Document(docx_file)
+    return "\n".join(para.text for para in doc.paragraphs)
+
+def extract_text(filename, document):
+    """Extract text from a PDF or DOCX document, dispatching on the filename."""
+    if filename.lower().endswith('.pdf'):
+        return extract_text_from_pdf(document)
+    return extract_text_from_docx(document)
+
+def extract_text_from_upload(filename, content):
+    """Extract text from raw upload bytes, returning (filename, text, error).
+
+    Runs in a worker process, so errors are returned rather than raised.
+    """
+    try:
+        return filename, extract_text(filename, io.BytesIO(content)), None
+    except Exception as e:
+        return filename, None, str(e)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""Gunicorn settings for serving the chatbot.
+
+Run from this directory with ``gunicorn chatbot:app``. On CPU hosts the app
+(and with it the QA model) is imported once in the master process and shared
+copy-on-write by every forked worker.
+"""
+
+import os
+import secrets
+
+# Without a configured key every worker that imports the app itself would
+# generate its own, and reject sessions issued by the others. Generate one
+# here in the master so all workers inherit the same key.
+os.environ.setdefault("CHATBOT_SECRET_KEY", secrets.token_hex(32))
+
+# Answer torch.cuda.is_available() from NVML rather than by initialising the
+# CUDA driver here in the master, which would leave forked workers unable to
+# use the GPU.
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+import torch
+
+# CUDA cannot be used in a process forked after it was initialised, so on GPU
+# hosts the models are loaded and warmed up in the worker instead.
+preload_app = not torch.cuda.is_available()
+
+# Threaded workers let one request tokenize while another waits on the
+# model, which releases the GIL during the forward pass. Without preloading,
+# every extra worker would put another copy of the models on the GPU and split
+# the micro-batches between processes, so a single worker serves all requests
+# on its threads. CHATBOT_WORKERS overrides the count.
+worker_class = "gthread"
+workers = int(os.environ.get("CHATBOT_WORKERS", max(2, (os.cpu_count() or 1) // 2) if preload_app else 1))
+threads = 8
+# A worker that loads and compiles its own models needs longer to boot
+timeout = 120 if preload_app else 600
+
+# Give each worker an equal share of the cores for inference, so workers
+# running at once do not oversubscribe the CPU.
+os.environ.setdefault("CHATBOT_CPU_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+
+def when_ready(server):
+    """Load and warm the models up in the master before any worker is forked."""
+    if preload_app:
+        import chatbot
+        # Load the summarizer now rather than on first use so workers share it
+        chatbot.get_summarizer()
+        chatbot.warmup_models()
+
+def post_fork(server, worker):
+    """Restart the logging and batching threads, which do not survive the fork."""
+    if preload_app:
+        import chatbot
+        chatbot.start_log_listener()
+        chatbot.start_batch_workers()
+
+def post_worker_init(worker):
+    """Without preloading, warm up the models each worker has just loaded."""
+    if not preload_app:
+        import chatbot
+        chatbot.warmup_models()
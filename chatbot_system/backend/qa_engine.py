@@ -0,0 +1,157 @@
+import numpy as np
+import torch
+
+MAX_SEQ_LEN = 384
+DOC_STRIDE = 128
+MAX_QUESTION_LEN = 64
+MAX_ANSWER_LEN = 15
+# Windows per forward pass; a GPU has headroom for far larger batches than a CPU
+FORWARD_BATCH_SIZE = 16
+GPU_FORWARD_BATCH_SIZE = 64
+
+def encode_context(tokenizer, context):
+    """Tokenize a context once so its token ids can be reused for every question about it."""
+    encoding = tokenizer(context, add_special_tokens=False, return_offsets_mapping=True)
+    return {
+        "input_ids": encoding["input_ids"],
+        "offsets": encoding["offset_mapping"],
+        "word_ids": encoding.word_ids()
+    }
+
+def build_features(tokenizer, question, encoded_context):
+    """Split the context into overlapping windows, each paired with the question.
+
+    Returns a list of (input_ids, context_start, window_start, window_length)
+    tuples, where context_start is the position of the first context token in
+    input_ids and window_start its index in the full context.
+    """
+    question_ids = tokenizer(question, add_special_tokens=False)["input_ids"][:MAX_QUESTION_LEN]
+    context_ids = encoded_context["input_ids"]
+    window_length = MAX_SEQ_LEN - len(question_ids) - tokenizer.num_special_tokens_to_add(pair=True)
+
+    features = []
+    window_start = 0
+    while True:
+        window_ids = context_ids[window_start:window_start + window_length]
+        input_ids = tokenizer.build_inputs_with_special_tokens(question_ids, window_ids)
+        # The pair is closed by a single special token after the context
+        context_start = len(input_ids) - len(window_ids) - 1
+        features.append((input_ids, context_start, window_start, len(window_ids)))
+        if window_start + window_length >= len(context_ids):
+            break
+        window_start += window_length - DOC_STRIDE
+    return features
+
+def to_device(array, device):
+    """Move a numpy array to device, through pinned memory for an asynchronous copy to the GPU."""
+    tensor = torch.from_numpy(array)
+    if device.type != "cuda":
+        return tensor
+    return tensor.pin_memory().to(device, non_blocking=True)
+
+def forward(model, tokenizer, features):
+    """Run the QA model over features in one padded forward pass.
+
+    Returns the start and end logits as float32 numpy arrays.
+    """
+    max_length = max(len(input_ids) for input_ids, _, _, _ in features)
+    input_ids = np.full((len(features), max_length), tokenizer.pad_token_id, dtype=np.int64)
+    attention_mask = np.zeros((len(features), max_length), dtype=np.int64)
+    for row, (ids, _, _, _) in enumerate(features):
+        input_ids[row, :len(ids)] = ids
+        attention_mask[row, :len(ids)] = 1
+
+    with torch.inference_mode():
+        outputs = model(
+            input_ids=to_device(input_ids, model.device),
+            attention_mask=to_device(attention_mask, model.device)
+        )
+        # Stack on the device so both logits come back in a single transfer
+        logits = torch.stack((outputs.start_logits, outputs.end_logits)).float().cpu().numpy()
+    return logits[0], logits[1]
+
+def run_model(model, tokenizer, features):
+    """Run the QA model over features in forward passes of capped size.
+
+    A long context yields dozens of windows, so they are batched rather than
+    run one by one, but capped at FORWARD_BATCH_SIZE (GPU_FORWARD_BATCH_SIZE
+    on a GPU) to bound activation memory. Windows are sorted
+    by length first so each pass pads to a similar length. Returns start and
+    end logits in the original order, padded to the longest feature.
+    """
+    max_length = max(len(input_ids) for input_ids, _, _, _ in features)
+    start_logits = np.zeros((len(features), max_length), dtype=np.float32)
+    end_logits = np.zeros((len(features), max_length), dtype=np.float32)
+    batch_size = GPU_FORWARD_BATCH_SIZE if model.device.type == "cuda" else FORWARD_BATCH_SIZE
+    order = np.argsort([len(input_ids) for input_ids, _, _, _ in features], kind="stable")
+    for begin in range(0, len(features), batch_size):
+        rows = order[begin:begin + batch_size]
+        chunk_start, chunk_end = forward(model, tokenizer, [features[row] for row in rows])
+        start_logits[rows, :chunk_start.shape[1]] = chunk_start
+        end_logits[rows, :chunk_end.shape[1]] = chunk_end
+    return start_logits, end_logits
+
+def softmax(logits):
+    """Numerically stable softmax over a 1-D array."""
+    exp = np.exp(logits - logits.max())
+    return exp / exp.sum()
+
+def best_span(features, start_logits, end_logits):
+    """Pick the highest scoring answer span across all windows.
+
+    Scores match the transformers QA pipeline: softmax over the CLS token and
+    the context tokens of each window, then the product of start and end
+    probabilities for context spans of at most MAX_ANSWER_LEN tokens. Keeping
+    CLS in the softmax means a window where the model predicts "no answer"
+    scores low, as it does in the pipeline.
+    """
+    best = (-1.0, 0, 0)
+    for row, (_, context_start, window_start, length) in enumerate(features):
+        positions = np.r_[0, context_start:context_start + length]
+        start_probs = softmax(start_logits[row, positions])[1:]
+        end_probs = softmax(end_logits[row, positions])[1:]
+        scores = np.triu(np.tril(np.outer(start_probs, end_probs), MAX_ANSWER_LEN - 1))
+        start, end = np.unravel_index(scores.argmax(), scores.shape)
+        if scores[start, end] > best[0]:
+            best = (float(scores[start, end]), window_start + start, window_start + end)
+    return best
+
+def word_span(encoded_context, start_token, end_token):
+    """Widen a token span to whole words and return its character offsets in the context.
+
+    Matches the pipeline's align_to_words, so a span ending inside a word
+    made of several sub-tokens covers the full word.
+    """
+    word_ids = encoded_context["word_ids"]
+    word = word_ids[start_token]
+    while start_token > 0 and word is not None and word_ids[start_token - 1] == word:
+        start_token -= 1
+    word = word_ids[end_token]
+    while end_token + 1 < len(word_ids) and word is not None and word_ids[end_token + 1] == word:
+        end_token += 1
+    offsets = encoded_context["offsets"]
+    return offsets[start_token][0], offsets[end_token][1]
+
+def answer_questions(model, tokenizer, items):
+    """Answer (question, context, encoded_context) items with one forward pass over all their windows.
+
+    Each encoded_context comes from encode_context, so a context shared by
+    several questions is only tokenized once.
+    """
+    item_features = [build_features(tokenizer, question, encoded) for question, _, encoded in items]
+    start_logits, end_logits = run_model(model, tokenizer, [f for features in item_features for f in features])
+
+    answers = []
+    row = 0
+    for (_, context, encoded_context), features in zip(items, item_features):
+        rows = slice(row, row + len(features))
+        row += len(features)
+        score, start_token, end_token = best_span(features, start_logits[rows], end_logits[rows])
+        start, end = word_span(encoded_context, start_token, end_token)
+        answers.append({
+            "score": score,
+            "start": start,
+            "end": end,
+            "answer": context[start:end].strip()
+        })
+    return answers
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The backend modules import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture(scope="session")
+def chatbot(tmp_path_factory):
+    """Import the app offline, so model loading fails fast instead of downloading, logging to a temp dir."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HF_HUB_OFFLINE", "1")
+        mp.setenv("TRANSFORMERS_OFFLINE", "1")
+        mp.chdir(tmp_path_factory.mktemp("chatbot"))
+        import chatbot
+    return chatbot
+
+@pytest.fixture
+def cpu_fp32(chatbot, monkeypatch):
+    """Pretend to run on a CPU without native bf16, where models are quantized to int8."""
+    import torch
+    monkeypatch.setattr(chatbot, "DEVICE", -1)
+    monkeypatch.setattr(chatbot, "DTYPE", torch.float32)
@@ -0,0 +1,42 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+def test_collect_batch_stops_at_max_batch(chatbot):
+    work_queue = queue.Queue()
+    for i in range(chatbot.MAX_BATCH + 3):
+        work_queue.put(i)
+
+    assert chatbot.collect_batch(work_queue) == list(range(chatbot.MAX_BATCH))
+    assert work_queue.qsize() == 3
+
+def test_collect_batch_returns_partial_batch_after_window(chatbot):
+    work_queue = queue.Queue()
+    work_queue.put("only")
+
+    assert chatbot.collect_batch(work_queue) == ["only"]
+
+def test_failed_batch_only_fails_the_bad_request(chatbot):
+    calls = []
+
+    def run_batch(payloads):
+        calls.append(payloads)
+        if "bad" in payloads:
+            raise RuntimeError("out of memory")
+        return [payload.upper() for payload in payloads]
+
+    batch = [(payload, Future()) for payload in ("a", "bad", "b")]
+    chatbot.resolve_batch(batch, run_batch)
+
+    assert batch[0][1].result() == "A"
+    assert batch[2][1].result() == "B"
+    assert isinstance(batch[1][1].exception(), RuntimeError)
+    assert calls == [["a", "bad", "b"], ["a"], ["bad"], ["b"]]
+
+def test_submit_to_batch_returns_result_from_worker(chatbot):
+    work_queue = queue.Queue()
+    threading.Thread(
+        target=chatbot.batch_worker, args=(work_queue, lambda payloads: [p * 2 for p in payloads]), daemon=True
+    ).start()
+
+    assert chatbot.submit_to_batch(work_queue, 21) == 42
@@ -0,0 +1,29 @@
+import io
+
+from cache import LRUCache, content_hash, stream_hash
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_lru_cache_get_returns_default_for_missing_key():
+    assert LRUCache(maxsize=1).get("missing", "default") == "default"
+
+def test_content_hash_is_the_same_for_str_and_bytes():
+    assert content_hash("résumé") == content_hash("résumé".encode())
+    assert content_hash("a") != content_hash("b")
+
+def test_stream_hash_matches_content_hash_and_rewinds():
+    content = b"x" * 3000
+    stream = io.BytesIO(content)
+
+    assert stream_hash(stream, chunk_size=1024) == content_hash(content)
+    assert stream.tell() == 0
@@ -0,0 +1,64 @@
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+import torch
+
+@pytest.fixture
+def fake_summarizer(chatbot, monkeypatch):
+    """Make pipeline() return a tiny model and reset the lazily loaded summarizer."""
+    summarizer = SimpleNamespace(model=torch.nn.Sequential(torch.nn.Linear(4, 4)))
+    monkeypatch.setattr(chatbot, "pipeline", lambda *args, **kwargs: summarizer)
+    monkeypatch.setattr(chatbot, "summarizer", None)
+    monkeypatch.setattr(chatbot, "summarizer_loaded", False)
+    return summarizer
+
+def test_summarizer_loads_when_quantization_fails(chatbot, cpu_fp32, fake_summarizer, monkeypatch):
+    fp32_model = fake_summarizer.model
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("no quantized engine")
+
+    monkeypatch.setattr(torch.quantization, "quantize_dynamic", fail)
+
+    assert chatbot.get_summarizer() is fake_summarizer
+    assert fake_summarizer.model is fp32_model
+
+def test_qa_pipeline_loads_when_quantization_fails(chatbot, cpu_fp32, monkeypatch):
+    qa = SimpleNamespace(model=torch.nn.Sequential(torch.nn.Linear(4, 4)))
+    fp32_model = qa.model
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("no quantized engine")
+
+    monkeypatch.setattr(chatbot, "load_quantized_qa_pipeline", fail)
+    monkeypatch.setattr(chatbot, "pipeline", lambda *args, **kwargs: qa)
+    monkeypatch.setattr(torch.quantization, "quantize_dynamic", fail)
+
+    assert chatbot.load_qa_pipeline() is qa
+    assert qa.model is fp32_model
+
+@pytest.fixture
+def install_bettertransformer(monkeypatch):
+    """Return a function that installs a stand-in optimum.bettertransformer with the given transform."""
+    def install(transform):
+        bettertransformer = ModuleType("optimum.bettertransformer")
+        bettertransformer.BetterTransformer = SimpleNamespace(transform=transform)
+        monkeypatch.setitem(sys.modules, "optimum", ModuleType("optimum"))
+        monkeypatch.setitem(sys.modules, "optimum.bettertransformer", bettertransformer)
+    return install
+
+def test_use_fused_attention_returns_transformed_model(chatbot, install_bettertransformer):
+    fused = SimpleNamespace()
+    install_bettertransformer(lambda model: fused)
+
+    assert chatbot.use_fused_attention(torch.nn.Linear(4, 4)) is fused
+
+def test_use_fused_attention_keeps_model_when_unsupported(chatbot, install_bettertransformer):
+    def unsupported(model):
+        raise NotImplementedError("not supported by BetterTransformer")
+
+    install_bettertransformer(unsupported)
+    model = torch.nn.Linear(4, 4)
+
+    assert chatbot.use_fused_attention(model) is model
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+import qa_engine
+
+class FakeEncoding(dict):
+    def __init__(self, input_ids, offsets, word_ids):
+        super().__init__(input_ids=input_ids, offset_mapping=offsets)
+        self._word_ids = word_ids
+
+    def word_ids(self):
+        return self._word_ids
+
+class FakeTokenizer:
+    """Splits on whitespace, then each word into sub-tokens of up to three characters, RoBERTa style."""
+
+    pad_token_id = 1
+    cls_token_id = 0
+    sep_token_id = 2
+
+    def __init__(self):
+        self.vocab = {}
+
+    def token_id(self, piece):
+        return self.vocab.setdefault(piece, len(self.vocab) + 10)
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False):
+        input_ids, offsets, word_ids = [], [], []
+        position = 0
+        for word_index, word in enumerate(text.split()):
+            start = text.index(word, position)
+            for begin in range(0, len(word), 3):
+                input_ids.append(self.token_id(word[begin:begin + 3]))
+                offsets.append((start + begin, start + min(begin + 3, len(word))))
+                word_ids.append(word_index)
+            position = start + len(word)
+        return FakeEncoding(input_ids, offsets, word_ids)
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 4 if pair else 2
+
+    def build_inputs_with_special_tokens(self, question_ids, context_ids):
+        return [self.cls_token_id] + question_ids + [self.sep_token_id] * 2 + context_ids + [self.sep_token_id]
+
+class FakeModel:
+    """Puts the highest start and end logits on the given token ids."""
+
+    device = torch.device("cpu")
+
+    def __init__(self, start_id, end_id):
+        self.start_id, self.end_id = start_id, end_id
+
+    def __call__(self, input_ids, attention_mask):
+        return SimpleNamespace(
+            start_logits=(input_ids == self.start_id).float() * 10,
+            end_logits=(input_ids == self.end_id).float() * 10
+        )
+
+def test_windows_cover_the_context_with_doc_stride_overlap():
+    tokenizer = FakeTokenizer()
+    context = " ".join(f"w{i}" for i in range(1000))
+    encoded = qa_engine.encode_context(tokenizer, context)
+
+    features = qa_engine.build_features(tokenizer, "what is it", encoded)
+
+    assert len(features) > 2
+    assert features[0][2] == 0
+    covered = set()
+    for (input_ids, context_start, window_start, length), following in zip(features, features[1:] + [None]):
+        assert len(input_ids) <= qa_engine.MAX_SEQ_LEN
+        assert input_ids[context_start:context_start + length] == encoded["input_ids"][window_start:window_start + length]
+        covered.update(range(window_start, window_start + length))
+        if following is not None:
+            assert window_start + length - following[2] == qa_engine.DOC_STRIDE
+    assert covered == set(range(len(encoded["input_ids"])))
+
+def test_no_answer_window_scores_low():
+    # CLS, two question tokens, two separators, three context tokens, a separator
+    features = [([0, 10, 11, 2, 2, 12, 13, 14, 2], 5, 0, 3)]
+    logits = np.zeros((1, 9), dtype=np.float32)
+    logits[0, 0] = 10.0
+
+    score, _, _ = qa_engine.best_span(features, logits, logits)
+
+    assert score < 1e-6
+
+def test_flat_logits_share_probability_with_cls():
+    features = [([0, 10, 11, 2, 2, 12, 13, 14, 2], 5, 0, 3)]
+    logits = np.zeros((1, 9), dtype=np.float32)
+
+    score, _, _ = qa_engine.best_span(features, logits, logits)
+
+    assert np.isclose(score, 1 / 16)
+
+def test_answer_offsets_map_back_to_whole_words():
+    tokenizer = FakeTokenizer()
+    context = "Plants   make food by photosynthesis in their leaves."
+    encoded = qa_engine.encode_context(tokenizer, context)
+    # Point both ends at a sub-token inside "photosynthesis"
+    model = FakeModel(tokenizer.token_id("ynt"), tokenizer.token_id("ynt"))
+
+    (answer,) = qa_engine.answer_questions(model, tokenizer, [("How do plants make food?", context, encoded)])
+
+    assert answer["answer"] == "photosynthesis"
+    assert context[answer["start"]:answer["end"]] == "photosynthesis"
+
+def test_answers_for_a_batch_come_back_in_order():
+    tokenizer = FakeTokenizer()
+    contexts = ["The sky is blue today.", "Grass is green."]
+    items = [("What colour?", context, qa_engine.encode_context(tokenizer, context)) for context in contexts]
+    model = FakeModel(tokenizer.token_id("gre"), tokenizer.token_id("en."))
+
+    answers = qa_engine.answer_questions(model, tokenizer, items)
+
+    assert answers[1]["answer"] == "green."
+    assert answers[0]["score"] < answers[1]["score"]
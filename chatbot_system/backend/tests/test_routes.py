@@ -0,0 +1,36 @@
+import re
+
+import pytest
+
+@pytest.fixture
+def client(chatbot):
+    return chatbot.app.test_client()
+
+@pytest.fixture
+def csrf_headers(client):
+    """Load the page to start a session and return the CSRF header the frontend would send."""
+    page = client.get("/").get_data(as_text=True)
+    token = re.search(r'name="csrf-token" content="([^"]+)"', page).group(1)
+    return {"X-CSRFToken": token}
+
+def test_post_without_csrf_token_is_forbidden(client):
+    response = client.post("/summarize", json={"context": "short text"})
+
+    assert response.status_code == 403
+    assert "CSRF" in response.get_json()["error"]
+
+def test_post_with_csrf_header_is_accepted(client, csrf_headers):
+    response = client.post("/summarize", json={"context": "short text"}, headers=csrf_headers)
+
+    assert response.status_code == 200
+    assert response.get_json() == {"summary": "short text"}
+
+@pytest.mark.parametrize("endpoint", ["/ask", "/summarize"])
+@pytest.mark.parametrize("body, content_type", [("not json", "text/plain"), ("{bad", "application/json")])
+def test_non_json_body_is_rejected_as_invalid_json(chatbot, client, csrf_headers, monkeypatch, endpoint, body, content_type):
+    monkeypatch.setattr(chatbot, "qa_pipeline", object())
+
+    response = client.post(endpoint, data=body, content_type=content_type, headers=csrf_headers)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Invalid JSON"}
@@ -0,0 +1,23 @@
+def words(count):
+    return " ".join(["word"] * count)
+
+def test_short_text_is_returned_as_is(chatbot):
+    assert chatbot.summarize_text("A short note.") == {"summary_text": "A short note."}
+
+def test_medium_pdf_text_is_summarized_by_its_first_two_sentences(chatbot):
+    context = f"First {words(30)} topic.\nSecond {words(30)} point!\nThird {words(30)} detail."
+
+    summary = chatbot.summarize_text(context)["summary_text"]
+
+    assert summary == f"First {words(30)} topic. Second {words(30)} point!"
+
+def test_medium_text_without_sentence_end_gets_a_period(chatbot):
+    context = words(60)
+
+    assert chatbot.summarize_text(context) == {"summary_text": context + "."}
+
+def test_long_text_without_summarizer_returns_none(chatbot, monkeypatch):
+    monkeypatch.setattr(chatbot, "get_summarizer", lambda: None)
+    monkeypatch.setattr(chatbot, "summary_cache", chatbot.LRUCache(maxsize=4))
+
+    assert chatbot.summarize_text(words(300)) is None
@@ -0,0 +1,42 @@
+import io
+
+import pytest
+from docx import Document
+from werkzeug.datastructures import FileStorage
+
+def docx_bytes(text):
+    buffer = io.BytesIO()
+    document = Document()
+    document.add_paragraph(text)
+    document.save(buffer)
+    return buffer.getvalue()
+
+def upload(content, filename):
+    return FileStorage(io.BytesIO(content), filename=filename)
+
+@pytest.fixture
+def empty_cache(chatbot, monkeypatch):
+    monkeypatch.setattr(chatbot, "extracted_text_cache", chatbot.LRUCache(maxsize=32))
+
+def test_extracts_several_files_in_order(chatbot, empty_cache):
+    files = [upload(docx_bytes(f"document {i}"), f"doc{i}.docx") for i in range(3)]
+
+    assert chatbot.extract_uploads(files) == [(f"doc{i}.docx", f"document {i}", None) for i in range(3)]
+
+def test_bad_file_reports_error_without_hiding_others(chatbot, empty_cache):
+    files = [upload(docx_bytes("fine"), "good.docx"), upload(b"not a pdf", "bad.pdf")]
+
+    good, bad = chatbot.extract_uploads(files)
+
+    assert good == ("good.docx", "fine", None)
+    assert bad[0] == "bad.pdf" and bad[1] is None and bad[2]
+
+def test_repeated_upload_is_served_from_cache(chatbot, empty_cache, monkeypatch):
+    content = docx_bytes("cached text")
+    calls = []
+    extract_text = chatbot.extract_text
+    monkeypatch.setattr(chatbot, "extract_text", lambda *args: calls.append(args) or extract_text(*args))
+
+    for _ in range(2):
+        assert chatbot.extract_uploads([upload(content, "a.docx")]) == [("a.docx", "cached text", None)]
+    assert len(calls) == 1
@@ -0,0 +1,39 @@
+import pytest
+
+@pytest.mark.parametrize("text", [
+    "What is the revenue?",
+    "Which plants do you like?",
+    "How many users joined in 2023, and why?",
+])
+def test_ordinary_questions_pass_the_injection_check(chatbot, text):
+    assert not chatbot.has_injection_characters(text)
+
+@pytest.mark.parametrize("text", [
+    "x' OR '1'='1",
+    "name; DROP TABLE users",
+    "<script>alert(1)</script>",
+    "admin --",
+    "1 UNION SELECT password",
+    "a LIKE b",
+    "line\nbreak",
+])
+def test_injection_patterns_are_detected(chatbot, text):
+    assert chatbot.has_injection_characters(text)
+
+def test_validate_text_strips_the_value(chatbot):
+    assert chatbot.validate_text("  What is it?  ", "Question") == (True, None, "What is it?")
+
+def test_validate_text_requires_a_value(chatbot):
+    assert chatbot.validate_text("   ", "Question") == (False, "Question is required", "")
+
+def test_validate_text_enforces_max_length_after_stripping(chatbot):
+    assert chatbot.validate_text(" abc ", "Context", max_length=3)[0]
+    assert chatbot.validate_text("abcd", "Context", max_length=3) == (
+        False, "Context too long (max 3 characters)", "abcd"
+    )
+
+def test_validate_text_only_scans_for_injection_when_asked(chatbot):
+    assert chatbot.validate_text("a = b", "Context")[0]
+    is_valid, error_message, _ = chatbot.validate_text("a = b", "Question", scan_injection=True)
+    assert not is_valid
+    assert "revise your question" in error_message
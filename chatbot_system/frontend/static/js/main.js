@@ -40,14 +40,14 @@ function showLoading(message = 'Processing...') {
 
 async function uploadPDF() {
     const fileInput = document.getElementById('pdfFile');
-    const file = fileInput.files[0];
+    const files = Array.from(fileInput.files);
 
-    if (!file) {
+    if (files.length === 0) {
         showError('Please select a file first!');
         return;
     }
 
-    if (!file.name.toLowerCase().endsWith('.pdf') && !file.name.toLowerCase().endsWith('.docx')) {
+    if (files.some(file => !file.name.toLowerCase().endsWith('.pdf') && !file.name.toLowerCase().endsWith('.docx'))) {
         showError('Please select a PDF or DOCX file');
         return;
     }
@@ -55,7 +55,7 @@ async function uploadPDF() {
     showLoading('Uploading file...');
 
     const formData = new FormData();
-    formData.append('file', file);
+    files.forEach(file => formData.append('file', file));
 
     try {
         const response = await fetch('/upload', {